@@ -6,20 +6,178 @@ Continuously monitors IRC #announce and RSS feed for new freeleech torrents.
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
 import argparse
 import sys
+import os
 import re
 import time
 import ssl
 import socket
+import selectors
 import threading
 import signal
 import json
-from ftplib import FTP
+import logging
+import io
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from ftplib import FTP, FTP_TLS
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime
-import bencodepy
+
+# Optional: httpx with HTTP/2 multiplexes size checks and downloads over one connection
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Optional: C-accelerated bencode decoder; the pure-Python walker below is the fallback
+try:
+    from fastbencode import bdecode as _bdecode
+except ImportError:
+    _bdecode = None
+
+
+# Precompiled patterns for the IRC announce and download hot paths
+_ID_RE = re.compile(r'torrent[:/](\d+)')
+_CAT_RE = re.compile(r'<([^>]+)>')
+_TITLE_RE = re.compile(r"Name:'([^']+)'")
+_FL_RE = re.compile(r"uploaded by '[^']+' freeleech\s", re.IGNORECASE)
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
+logger = logging.getLogger('monitor')
+
+# IRC numerics awaited during connect, and the error replies that abort the wait
+_RPL_WELCOME = ('001', '376', '422')  # welcome, end of MOTD, no MOTD
+_RPL_ENDOFNAMES = ('366',)
+_REGISTER_ERRORS = ('432', '433', '436', '464', '465')
+_JOIN_ERRORS = ('403', '405', '471', '473', '474', '475', '477')
+IRC_REPLY_TIMEOUT = 15
+
+# Processed torrent IDs are persisted here (inside download_dir) and capped in memory
+PROCESSED_FILE = 'processed.txt'
+MAX_PROCESSED = 50000
+
+
+def _bencode_skip(data: bytes, i: int) -> int:
+    """Return the offset just past the bencoded value starting at data[i]."""
+    c = data[i]
+    if c == 0x69:  # 'i'
+        return data.index(b'e', i) + 1
+    if c == 0x6c or c == 0x64:  # 'l' / 'd'
+        i += 1
+        while data[i] != 0x65:  # 'e'
+            i = _bencode_skip(data, i)
+        return i + 1
+    # Byte string: <length>:<bytes>, jumped over without copying
+    colon = data.index(b':', i)
+    return colon + 1 + int(data[i:colon])
+
+
+def _bencode_int(data: bytes, i: int) -> int:
+    """Decode the bencoded integer starting at data[i]."""
+    return int(data[i + 1:data.index(b'e', i)])
+
+
+def _bencode_dict(data: bytes, i: int):
+    """Yield (key, value_offset) for the dict at data[i] without decoding values."""
+    i += 1
+    while data[i] != 0x65:
+        colon = data.index(b':', i)
+        end = colon + 1 + int(data[i:colon])
+        yield data[colon + 1:end], end
+        i = _bencode_skip(data, end)
+
+
+def _skim_total_size(data: bytes) -> int:
+    """Pure-Python torrent size: walks the bencoded structure and only decodes
+    info.length or the files[].length entries; pieces is skipped by offset.
+    """
+    for key, pos in _bencode_dict(data, 0):
+        if key != b'info':
+            continue
+        
+        length = None
+        files_total = 0
+        for info_key, info_pos in _bencode_dict(data, pos):
+            # Single file torrent
+            if info_key == b'length':
+                length = _bencode_int(data, info_pos)
+            # Multi-file torrent
+            elif info_key == b'files':
+                j = info_pos + 1
+                while data[j] != 0x65:
+                    for file_key, file_pos in _bencode_dict(data, j):
+                        if file_key == b'length':
+                            files_total += _bencode_int(data, file_pos)
+                    j = _bencode_skip(data, j)
+        return length if length is not None else files_total
+    return 0
+
+
+def torrent_total_size(data: bytes) -> int:
+    """Total payload size in bytes of a .torrent file."""
+    if _bdecode is None:
+        return _skim_total_size(data)
+    
+    # fastbencode decodes in C, which beats the Python walker on
+    # torrents with large file lists
+    info = _bdecode(data).get(b'info', {})
+    # Single file torrent
+    if b'length' in info:
+        return info[b'length']
+    # Multi-file torrent
+    return sum(file_info[b'length'] for file_info in info.get(b'files', ()))
+
+
+def _split_cpus() -> Tuple[Optional[Set[int]], Optional[Set[int]]]:
+    """Reserve one CPU for the IRC reader and leave the rest to the workers.
+    
+    Returns (None, None) where affinity isn't supported or only one CPU is usable.
+    """
+    if not hasattr(os, 'sched_getaffinity'):
+        return None, None
+    cpus = os.sched_getaffinity(0)
+    if len(cpus) < 2:
+        return None, None
+    irc_cpu = min(cpus)
+    return {irc_cpu}, cpus - {irc_cpu}
+
+
+IRC_CPUS, WORKER_CPUS = _split_cpus()
+
+# Nice value at startup; worker threads reset to it because Linux threads
+# inherit the (possibly raised) priority of the IRC thread that spawns them
+BASE_NICE = os.getpriority(os.PRIO_PROCESS, 0) if hasattr(os, 'getpriority') else None
+
+
+def _pin_current_thread(cpus: Optional[Set[int]]):
+    """Best effort: restrict the calling thread to `cpus` (Linux only)."""
+    if not cpus:
+        return
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError as e:
+        logger.debug("[MONITOR] Could not set CPU affinity: %s", e)
+
+
+def _init_worker_thread():
+    """Pool initializer: move off the IRC reader's CPU and drop its raised priority."""
+    _pin_current_thread(WORKER_CPUS)
+    if BASE_NICE is not None:
+        try:
+            # Lowering priority back to the base value never needs privileges
+            os.setpriority(os.PRIO_PROCESS, 0, BASE_NICE)
+        except OSError as e:
+            logger.debug("[MONITOR] Could not reset thread priority: %s", e)
 
 
 class TorrentLeechIRC:
@@ -40,11 +198,19 @@ class TorrentLeechIRC:
         self.monitor_thread = None
         self.channel = "#tlannounces"
         self.on_freeleech_callback = on_freeleech_callback
+        # Persistent receive buffer so lines split across recv() calls survive
+        self._rx_buf = bytearray()
+        self._recv_buf = bytearray(65536)
+        self._recv_view = memoryview(self._recv_buf)
+        # Readiness selector plus a wakeup socketpair so stop_monitor returns instantly
+        self._selector = None
+        self._wake_r = None
+        self._wake_w = None
         
     def connect(self) -> bool:
         """Connect to IRC server with SSL."""
         try:
-            print(f"[IRC] Connecting to {self.server}:{self.port}...")
+            logger.info("[IRC] Connecting to %s:%s...", self.server, self.port)
             
             # Create socket
             raw_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -62,168 +228,279 @@ class TorrentLeechIRC:
             
             # Connect
             self.socket.connect((self.server, self.port))
+            self._rx_buf = bytearray()
             
             # Send NICK and USER (PASS before NICK if password provided)
             if self.password:
-                print(f"  Authenticating with password...")
+                logger.info("[IRC] Authenticating with password...")
                 self.send(f"PASS {self.password}")
-                time.sleep(0.5)
             
             self.send(f"NICK {self.nickname}")
             self.send(f"USER {self.nickname} 0 * :{self.nickname}")
             
             # Wait for registration to complete
-            print("  Waiting for registration...")
-            time.sleep(10)
-            
-            # Read and respond to initial messages (including PING)
-            for i in range(10):
-                lines = self._read_lines(timeout=0.5)
-                for line in lines:
-                    if line.startswith('PING'):
-                        self.send(line.replace('PING', 'PONG'))
-                time.sleep(0.3)
+            logger.info("[IRC] Waiting for registration...")
+            self._wait_for_reply(_RPL_WELCOME, _REGISTER_ERRORS)
             
             # Join channel
-            print(f"  Joining {self.channel}...")
+            logger.info("[IRC] Joining %s...", self.channel)
             self.send(f"JOIN {self.channel}")
-            time.sleep(2)
-            self._read_lines(timeout=1)
+            self._wait_for_reply(_RPL_ENDOFNAMES, _JOIN_ERRORS, channel=self.channel)
             
             self.connected = True
-            print(f"[IRC] ✓ Connected and joined {self.channel}")
+            logger.info("[IRC] ✓ Connected and joined %s", self.channel)
             return True
             
         except Exception as e:
-            print(f"[IRC] Error connecting: {e}")
+            logger.error("[IRC] Error connecting: %s", e)
             return False
     
+    def _wait_for_reply(self, numerics: Tuple[str, ...], errors: Tuple[str, ...],
+                        channel: str = None, timeout: float = IRC_REPLY_TIMEOUT):
+        """Read lines until one of `numerics` arrives (for `channel`, if given).
+        
+        Everything else goes through the normal dispatcher, so PINGs are
+        answered while waiting. Raises ConnectionError on an error reply
+        and TimeoutError if nothing matches within `timeout` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"no {'/'.join(numerics)} reply within {timeout}s")
+            
+            found = False
+            for line in self._read_lines(timeout=min(remaining, 0.2)):
+                # ":server NUMERIC nick [#channel] :text"
+                parts = line.split(' ', 4)
+                if parts[0] == 'ERROR' or (len(parts) > 1 and parts[1] in errors):
+                    raise ConnectionError(line)
+                if len(parts) > 1 and parts[1] in numerics and (channel is None or (len(parts) > 3 and parts[3] == channel)):
+                    found = True
+                else:
+                    self._handle_line(line)
+            if found:
+                return
+    
     def send(self, message: str):
         """Send a message to the IRC server."""
         try:
             self.socket.send(f"{message}\r\n".encode('utf-8'))
         except Exception as e:
-            print(f"[IRC] Error sending message: {e}")
+            logger.error("[IRC] Error sending message: %s", e)
     
     def _read_lines(self, timeout: float = 0.1) -> List[str]:
-        """Read available lines from IRC server."""
-        lines = []
+        """Read available lines from IRC server.
+        
+        A timeout of 0 drains whatever is readable without blocking.
+        Raises ConnectionError if the server closed the connection.
+        """
         self.socket.settimeout(timeout)
+        closed = False
         try:
             while True:
-                data = self.socket.recv(4096).decode('utf-8', errors='ignore')
-                if not data:
+                n = self.socket.recv_into(self._recv_view)
+                if not n:
+                    closed = True
                     break
-                lines.extend(data.split('\r\n'))
-        except socket.timeout:
-            pass
-        except Exception:
+                self._rx_buf += self._recv_view[:n]
+        except (socket.timeout, BlockingIOError, ssl.SSLWantReadError):
             pass
-        return [line for line in lines if line]
+        # Decode every complete line in one pass; the incomplete tail stays
+        # in the same bytearray for the next read
+        end = self._rx_buf.rfind(b'\r\n')
+        if end < 0:
+            lines = []
+        else:
+            text = self._rx_buf[:end].decode('utf-8', 'ignore')
+            del self._rx_buf[:end + 2]
+            lines = [line for line in text.split('\r\n') if line]
+        if closed and not lines:
+            raise ConnectionError("connection closed by server")
+        return lines
     
     def parse_announce_message(self, message: str) -> Optional[Dict]:
-        """Parse announce message for torrent info and freeleech status."""
+        """Parse announce message for torrent info. Returns None unless it is freeleech."""
         try:
             # Example format from #tlannounces:
             # :_AnnounceBot_!Announce@torrentleech.org PRIVMSG #tlannounces :00,04New Torrent Announcement:00,12 <Category>  Name:'Title' uploaded by 'User' freeleech - 01,15 https://www.torrentleech.org/torrent/ID
             
+            # Cheap substring test first; non-freeleech announces are discarded
+            # by the caller anyway, so skip the remaining regexes for them
+            if 'freeleech' not in message.lower():
+                return None
+            
+            # Check for freeleech - must be as a standalone word, not part of another word
+            # The word "freeleech" appears between "uploaded by 'User'" and the URL
+            # Example: "uploaded by 'Anonymous' freeleech - https://..."
+            # Use word boundary to avoid matching "FREQUENCY" or similar
+            freeleech = bool(_FL_RE.search(message))
+            if not freeleech:
+                return None
+            
             # Extract torrent ID from URL
-            id_match = re.search(r'torrent[:/](\d+)', message)
+            id_match = _ID_RE.search(message)
             if not id_match:
                 return None
             
             torrent_id = id_match.group(1)
             
             # Extract category (between < >)
-            category_match = re.search(r'<([^>]+)>', message)
+            category_match = _CAT_RE.search(message)
             category = category_match.group(1).strip() if category_match else None
             
             # Extract title (between Name:' and ')
-            title_match = re.search(r"Name:'([^']+)'", message)
+            title_match = _TITLE_RE.search(message)
             title = title_match.group(1).strip() if title_match else None
             
-            # Check for freeleech - must be as a standalone word, not part of another word
-            # The word "freeleech" appears between "uploaded by 'User'" and the URL
-            # Example: "uploaded by 'Anonymous' freeleech - https://..."
-            # Use word boundary to avoid matching "FREQUENCY" or similar
-            freeleech = bool(re.search(r"uploaded by '[^']+' freeleech\s", message, re.IGNORECASE))
-            
             return {
                 'id': torrent_id,
                 'freeleech': freeleech,
                 'category': category,
                 'title': title,
                 'message': message,
-                'timestamp': datetime.now()
+                # Epoch seconds; format with time.localtime() only where displayed
+                'timestamp': time.time()
             }
             
         except Exception as e:
             return None
     
+    def _on_privmsg(self, parts: List[str], line: str):
+        """Handle a PRIVMSG; only announces in our channel are parsed."""
+        if len(parts) < 4 or parts[2] != self.channel:
+            return
+        
+        # Substring prefilter before touching the regex engine
+        if "New Torrent Announcement" not in line or "Name:'" not in line:
+            return
+        
+        announce_info = self.parse_announce_message(line)
+        if announce_info:
+            self.freeleech_torrents.add(announce_info['id'])
+            logger.info("[IRC] ✓ Freeleech: [%s] %.60s... (ID: %s)",
+                        announce_info['category'], announce_info['title'], announce_info['id'])
+            
+            # Callback for immediate processing
+            if self.on_freeleech_callback:
+                self.on_freeleech_callback(announce_info)
+    
+    # IRC command -> handler; anything else (NOTICE, JOIN, numerics) is ignored
+    _HANDLERS = {
+        'PRIVMSG': _on_privmsg,
+    }
+    
+    def _handle_line(self, line: str):
+        """Dispatch one IRC line on its command token."""
+        # ":prefix COMMAND target :trailing" or "PING :token"
+        parts = line.split(' ', 3)
+        if parts[0] == 'PING':
+            self.send('PONG' + line[4:])
+            return
+        
+        if len(parts) > 1:
+            handler = self._HANDLERS.get(parts[1])
+            if handler:
+                handler(self, parts, line)
+    
     def start_monitor(self):
         """Start monitoring in background thread."""
         if self.running:
             return
         
         self.running = True
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
         
         def monitor_loop():
-            self.socket.settimeout(1)
+            # Keep the latency-sensitive reader on its own core so PINGs are
+            # answered promptly on busy hosts; raise priority if permitted
+            # (on Linux nice() applies to the calling thread only)
+            _pin_current_thread(IRC_CPUS)
+            if IRC_CPUS:
+                try:
+                    os.nice(-5)
+                except OSError:
+                    pass
+            
             reconnect_attempts = 0
             max_reconnect = 5
+            registered = None
             
             while self.running:
                 try:
                     if not self.connected:
                         if reconnect_attempts < max_reconnect:
-                            print(f"[IRC] Attempting to reconnect ({reconnect_attempts + 1}/{max_reconnect})...")
+                            logger.warning("[IRC] Attempting to reconnect (%d/%d)...", reconnect_attempts + 1, max_reconnect)
                             if self.connect():
                                 reconnect_attempts = 0
                             else:
                                 reconnect_attempts += 1
                                 time.sleep(3)
                         else:
-                            print("[IRC] Max reconnection attempts reached. Stopping IRC monitor.")
+                            logger.error("[IRC] Max reconnection attempts reached. Stopping IRC monitor.")
                             break
                         continue
                     
-                    lines = self._read_lines(timeout=1)
+                    # (Re)register the IRC socket after connecting
+                    if registered is not self.socket:
+                        if registered is not None:
+                            self._selector.unregister(registered)
+                        self._selector.register(self.socket, selectors.EVENT_READ)
+                        registered = self.socket
+                    
+                    # Block until the server sends something or stop_monitor wakes us
+                    lines = []
+                    for key, _ in self._selector.select(timeout=30):
+                        if key.fileobj is self._wake_r:
+                            try:
+                                self._wake_r.recv(64)
+                            except BlockingIOError:
+                                pass
+                        else:
+                            lines = self._read_lines(timeout=0)
+                    
                     for line in lines:
-                        if line.startswith('PING'):
-                            self.send(line.replace('PING', 'PONG'))
-                        elif 'PRIVMSG' in line and self.channel in line:
-                            announce_info = self.parse_announce_message(line)
-                            if announce_info:
-                                self.freeleech_torrents.add(announce_info['id'])
-                                timestamp = announce_info['timestamp'].strftime('%H:%M:%S')
-                                category = announce_info.get('category', 'Unknown')
-                                title = announce_info.get('title', 'Unknown')[:60]
-                                print(f"[IRC] [{timestamp}] ✓ Freeleech: [{category}] {title}... (ID: {announce_info['id']})")
-                                
-                                # Callback for immediate processing
-                                if self.on_freeleech_callback:
-                                    self.on_freeleech_callback(announce_info)
+                        self._handle_line(line)
                 
                 except socket.error:
-                    print("[IRC] Connection lost. Will attempt to reconnect...")
+                    logger.warning("[IRC] Connection lost. Will attempt to reconnect...")
                     self.connected = False
+                    if registered is not None:
+                        try:
+                            self._selector.unregister(registered)
+                        except Exception:
+                            pass
+                        registered = None
                     try:
                         self.socket.close()
                     except:
                         pass
                 except Exception as e:
-                    print(f"[IRC] Error in monitor loop: {e}")
+                    logger.error("[IRC] Error in monitor loop: %s", e)
                     time.sleep(5)
         
         self.monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
         self.monitor_thread.start()
-        print("[IRC] Background monitor started")
+        logger.info("[IRC] Background monitor started")
     
     def stop_monitor(self):
         """Stop background monitoring."""
         self.running = False
+        if self._wake_w:
+            try:
+                self._wake_w.send(b'\0')
+            except Exception:
+                pass
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
+        if self._selector:
+            self._selector.close()
+            self._wake_r.close()
+            self._wake_w.close()
+            self._selector = self._wake_r = self._wake_w = None
     
     def is_freeleech(self, torrent_id: str) -> bool:
         """Check if a torrent ID is in the freeleech set."""
@@ -246,10 +523,15 @@ class TorrentMonitor:
     def __init__(self, rss_url: str, categories: List[str] = None, 
                  download_dir: str = ".", irc_nick: str = None, irc_pass: str = None,
                  ftp_host: str = None, ftp_port: int = 21, ftp_user: str = None, 
-                 ftp_pass: str = None, ftp_folder: str = "/",
+                 ftp_pass: str = None, ftp_folder: str = "/", ftp_tls: bool = False,
                  min_size: float = None, max_size: float = None):
         self.rss_url = rss_url
         self.categories = categories
+        # Lowercased once so filtering doesn't redo it per entry
+        self._lower_categories = [cat.lower() for cat in categories] if categories else []
+        # Conditional GET validators from the last RSS response
+        self._rss_etag = None
+        self._rss_modified = None
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
         self.min_size = min_size  # Size in GB
@@ -261,12 +543,21 @@ class TorrentMonitor:
         self.ftp_user = ftp_user
         self.ftp_pass = ftp_pass
         self.ftp_folder = ftp_folder
+        self.ftp_tls = ftp_tls
         self.ftp_enabled = bool(ftp_host and ftp_user and ftp_pass)
+        # Persistent control connection, reused across uploads
+        self._ftp: Optional[FTP] = None
+        self._ftp_lock = threading.Lock()
+        # Uploads run off the IRC/RSS threads; one worker, since they share one connection
+        self._upload_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ftp-upload',
+                                               initializer=_init_worker_thread)
         
-        # Track processed torrents to avoid duplicates
-        self.processed_torrents: Set[str] = set()
-        self.last_rss_check = 0
-        self.running = False
+        # Track processed torrents to avoid duplicates (survives restarts)
+        self.processed_torrents: Dict[int, None] = self._load_processed()
+        self._processed_file = open(self.download_dir / PROCESSED_FILE, 'a')
+        # Guards check-and-mark and file appends across threads; plain reads stay lock-free
+        self._processed_lock = threading.Lock()
+        self._stop = threading.Event()
         
         # Statistics
         self.stats = {
@@ -276,6 +567,8 @@ class TorrentMonitor:
             'errors': 0,
             'started_at': datetime.now()
         }
+        # Counters are bumped from the IRC, main, worker and upload threads
+        self._stats_lock = threading.Lock()
         
         # Initialize IRC client
         self.irc_client = TorrentLeechIRC(
@@ -284,17 +577,87 @@ class TorrentMonitor:
             on_freeleech_callback=self.on_freeleech_announce
         )
         
-        self.session = requests.Session()
+        # Shared HTTP client for size checks and downloads; call sites only use
+        # get(url, timeout=...), raise_for_status() and .content, which both provide
+        if httpx is not None:
+            self.session = httpx.Client(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=8),
+                timeout=30,
+                follow_redirects=True
+            )
+        else:
+            self.session = requests.Session()
+            # Enough pooled keep-alive connections for the worker threads
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        
+        # Size checks and downloads run here so the IRC thread never blocks on HTTP
+        self._work_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='torrent-worker',
+                                             initializer=_init_worker_thread)
+    
+    def _load_processed(self) -> Dict[int, None]:
+        """Load processed torrent IDs from disk, keeping the newest MAX_PROCESSED."""
+        path = self.download_dir / PROCESSED_FILE
+        try:
+            with open(path, 'r') as f:
+                ids = [int(tid) for tid in f.read().split() if tid.isdigit()]
+        except FileNotFoundError:
+            return OrderedDict()
+        
+        processed = OrderedDict.fromkeys(ids[-MAX_PROCESSED:])
+        
+        # Compact the file if it has grown past what we keep in memory
+        if len(ids) > len(processed):
+            with open(path, 'w') as f:
+                f.writelines(f"{tid}\n" for tid in processed)
+        
+        logger.info("[MONITOR] Loaded %d processed torrent IDs from %s", len(processed), path)
+        return processed
+    
+    def is_processed(self, torrent_id: str) -> bool:
+        """Check if a torrent ID has already been handled."""
+        return int(torrent_id) in self.processed_torrents
+    
+    def mark_processed(self, torrent_id: str):
+        """Record a torrent ID in memory so this session won't handle it again."""
+        tid = int(torrent_id)
+        self.processed_torrents[tid] = None
+        if len(self.processed_torrents) > MAX_PROCESSED:
+            self.processed_torrents.popitem(last=False)
+    
+    def save_processed(self, torrent_id: str):
+        """Append a torrent ID to the processed file.
+        
+        Only called once a torrent is finished with (downloaded, or rejected
+        by the size filter), so failed downloads are retried after a restart.
+        """
+        tid = int(torrent_id)
+        with self._processed_lock:
+            try:
+                self._processed_file.write(f"{tid}\n")
+                self._processed_file.flush()
+            except Exception as e:
+                logger.error("[MONITOR] Error saving processed ID %d: %s", tid, e)
+    
+    def _claim(self, torrent_id: str) -> bool:
+        """Atomically mark a torrent ID processed; False if it already was."""
+        with self._processed_lock:
+            if self.is_processed(torrent_id):
+                return False
+            self.mark_processed(torrent_id)
+            return True
     
     def on_freeleech_announce(self, announce_info: Dict):
         """Callback when IRC detects a new freeleech announce."""
         torrent_id = announce_info['id']
         
         # Check if already processed
-        if torrent_id in self.processed_torrents:
+        if self.is_processed(torrent_id):
             return
         
         # Only process if it's freeleech
@@ -304,61 +667,102 @@ class TorrentMonitor:
         # Check category filter
         if self.categories and announce_info.get('category'):
             # Category from IRC might have " :: " format like "TV :: Episodes HD"
-            announce_cat = announce_info['category']
-            if not any(cat.lower() in announce_cat.lower() for cat in self.categories):
+            announce_cat = announce_info['category'].lower()
+            if not any(cat in announce_cat for cat in self._lower_categories):
                 return
         
-        # Mark as processed
-        self.processed_torrents.add(torrent_id)
-        self.stats['torrents_found'] += 1
+        # Mark as processed (the RSS thread may have claimed it meanwhile)
+        if not self._claim(torrent_id):
+            return
+        self._count('torrents_found')
         
-        title = announce_info.get('title', f'torrent_{torrent_id}')
-        print(f"[IRC] ✓ Freeleech match: [{announce_info.get('category', 'Unknown')}] {title[:60]}...")
+        logger.info("[IRC] ✓ Freeleech match: [%s] %.60s...",
+                    announce_info.get('category', 'Unknown'), announce_info.get('title'))
+        
+        # Network IO happens on the worker pool
+        self._work_pool.submit(self._process_torrent, announce_info)
+    
+    def _count(self, key: str):
+        """Increment a statistics counter."""
+        with self._stats_lock:
+            self.stats[key] += 1
+    
+    def _process_torrent(self, announce_info: Dict):
+        """Size-check and download an accepted IRC announce (runs on the worker pool)."""
+        # Nothing awaits the pool's futures, so errors must be logged here
+        try:
+            self._process_announce(announce_info)
+        except Exception as e:
+            logger.error("[IRC] Error processing torrent %s: %s", announce_info.get('id'), e)
+            self._count('errors')
+    
+    def _process_announce(self, announce_info: Dict):
+        """Build the download URL, apply size filters and download."""
+        torrent_id = announce_info['id']
+        title = announce_info.get('title') or f'torrent_{torrent_id}'
         
         # Build download URL using RSS key from feed URL
         # Format: https://www.torrentleech.org/rss/download/TORRENTID/RSSKEY/filename.torrent
         rss_key = self.rss_url.split('/')[-1]
         
         # Sanitize title for URL
-        safe_title = re.sub(r'[<>:"/\\|?*]', '_', title)
+        safe_title = _SANITIZE_RE.sub('_', title)
         safe_title = safe_title[:200]  # Limit length
         
         download_url = f"https://www.torrentleech.org/rss/download/{torrent_id}/{rss_key}/{safe_title}.torrent"
         
         # Check size if filters are set
+        content = None
         if self.min_size is not None or self.max_size is not None:
-            size_gb = self.get_torrent_size(download_url)
+            size_gb, content = self.get_torrent_size(download_url)
             if size_gb is not None:
                 if self.min_size is not None and size_gb < self.min_size:
-                    print(f"[IRC] ✗ Skipped (too small: {size_gb:.2f} GB < {self.min_size} GB): {title[:40]}...")
+                    logger.info("[IRC] ✗ Skipped (too small: %.2f GB < %s GB): %.40s...", size_gb, self.min_size, title)
+                    self.save_processed(torrent_id)
                     return
                 if self.max_size is not None and size_gb > self.max_size:
-                    print(f"[IRC] ✗ Skipped (too large: {size_gb:.2f} GB > {self.max_size} GB): {title[:40]}...")
+                    logger.info("[IRC] ✗ Skipped (too large: %.2f GB > %s GB): %.40s...", size_gb, self.max_size, title)
+                    self.save_processed(torrent_id)
                     return
-                print(f"[IRC] Size: {size_gb:.2f} GB")
+                logger.info("[IRC] Size: %.2f GB", size_gb)
         
         # Download immediately
-        self.download_torrent(download_url, title)
+        if self.download_torrent(download_url, title, content):
+            self.save_processed(torrent_id)
     
     def check_rss_feed(self):
         """Check RSS feed for new torrents."""
         try:
-            self.stats['rss_checks'] += 1
+            self._count('rss_checks')
+            
+            feed = feedparser.parse(self.rss_url, etag=self._rss_etag, modified=self._rss_modified)
+            
+            # Remember validators so the next poll can be answered with 304
+            self._rss_etag = feed.get('etag', self._rss_etag)
+            self._rss_modified = feed.get('modified', self._rss_modified)
             
-            feed = feedparser.parse(self.rss_url)
+            # Feed unchanged since last check
+            if feed.get('status') == 304:
+                return
             
             if not feed.entries:
                 return
             
             new_found = 0
+            freeleech_torrents = self.irc_client.freeleech_torrents
             
+            # Cheapest checks first: most entries are already processed or not freeleech
             for entry in feed.entries:
                 # Extract torrent ID
                 torrent_id = None
                 if hasattr(entry, 'id'):
-                    torrent_id = entry.id.split('/')[-1]
+                    torrent_id = entry.id.rpartition('/')[2]
                 
-                if not torrent_id or torrent_id in self.processed_torrents:
+                if not torrent_id or not torrent_id.isdigit() or self.is_processed(torrent_id):
+                    continue
+                
+                # Check if freeleech (from IRC data)
+                if torrent_id not in freeleech_torrents:
                     continue
                 
                 # Parse category
@@ -368,17 +772,15 @@ class TorrentMonitor:
                 
                 # Check category filter
                 if self.categories:
-                    if not any(cat.lower() in category.lower() for cat in self.categories):
+                    category_lower = category.lower()
+                    if not any(cat in category_lower for cat in self._lower_categories):
                         continue
                 
-                # Check if freeleech (from IRC data)
-                if not self.irc_client.is_freeleech(torrent_id):
+                # Mark as processed (the IRC thread may have claimed it meanwhile)
+                if not self._claim(torrent_id):
                     continue
-                
-                # Mark as processed
-                self.processed_torrents.add(torrent_id)
                 new_found += 1
-                self.stats['torrents_found'] += 1
+                self._count('torrents_found')
                 
                 # Download
                 title = entry.get('title', f'torrent_{torrent_id}')
@@ -387,226 +789,283 @@ class TorrentMonitor:
                 if link:
                     # Check size if filters are set
                     skip = False
+                    content = None
                     if self.min_size is not None or self.max_size is not None:
-                        size_gb = self.get_torrent_size(link)
+                        size_gb, content = self.get_torrent_size(link)
                         if size_gb is not None:
                             if self.min_size is not None and size_gb < self.min_size:
-                                print(f"[RSS] ✗ Skipped (too small: {size_gb:.2f} GB < {self.min_size} GB): {title[:40]}...")
+                                logger.info("[RSS] ✗ Skipped (too small: %.2f GB < %s GB): %.40s...", size_gb, self.min_size, title)
                                 skip = True
                             elif self.max_size is not None and size_gb > self.max_size:
-                                print(f"[RSS] ✗ Skipped (too large: {size_gb:.2f} GB > {self.max_size} GB): {title[:40]}...")
+                                logger.info("[RSS] ✗ Skipped (too large: %.2f GB > %s GB): %.40s...", size_gb, self.max_size, title)
                                 skip = True
                             else:
-                                print(f"[RSS] ✓ New freeleech: [{category}] {title[:60]}... ({size_gb:.2f} GB)")
+                                logger.info("[RSS] ✓ New freeleech: [%s] %.60s... (%.2f GB)", category, title, size_gb)
                     
-                    if not skip:
+                    if skip:
+                        self.save_processed(torrent_id)
+                    else:
                         if self.min_size is None and self.max_size is None:
-                            print(f"[RSS] ✓ New freeleech: [{category}] {title[:60]}...")
-                        self.download_torrent(link, title)
+                            logger.info("[RSS] ✓ New freeleech: [%s] %.60s...", category, title)
+                        if self.download_torrent(link, title, content):
+                            self.save_processed(torrent_id)
                 else:
-                    print(f"[RSS] Warning: No download link for {title[:40]}")
+                    logger.warning("[RSS] Warning: No download link for %.40s", title)
             
             if new_found > 0:
-                print(f"[RSS] Found {new_found} new freeleech torrents")
+                logger.info("[RSS] Found %d new freeleech torrents", new_found)
                 
         except Exception as e:
-            print(f"[RSS] Error checking feed: {e}")
-            self.stats['errors'] += 1
+            logger.error("[RSS] Error checking feed: %s", e)
+            self._count('errors')
     
-    def get_torrent_size(self, url: str) -> Optional[float]:
-        """Download torrent file temporarily and get its size in GB."""
+    def get_torrent_size(self, url: str) -> Tuple[Optional[float], Optional[bytes]]:
+        """Download torrent file and get its size in GB.
+        
+        The raw bytes are returned too, so download_torrent can save them
+        without fetching the file a second time.
+        """
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            # Parse torrent file
-            torrent_data = bencodepy.decode(response.content)
-            
-            # Calculate total size
-            total_size = 0
-            if b'info' in torrent_data:
-                info = torrent_data[b'info']
-                
-                # Single file torrent
-                if b'length' in info:
-                    total_size = info[b'length']
-                # Multi-file torrent
-                elif b'files' in info:
-                    for file_info in info[b'files']:
-                        total_size += file_info[b'length']
-            
             # Convert bytes to GB
-            size_gb = total_size / (1024 ** 3)
-            return size_gb
+            size_gb = torrent_total_size(response.content) / (1024 ** 3)
+            return size_gb, response.content
             
         except Exception as e:
-            print(f"[SIZE] Error getting torrent size: {e}")
-            return None
+            logger.error("[SIZE] Error getting torrent size: %s", e)
+            return None, None
+    
+    def _close_ftp(self):
+        """Close the persistent FTP connection, if any."""
+        if self._ftp is not None:
+            try:
+                self._ftp.quit()
+            except Exception:
+                try:
+                    self._ftp.close()
+                except Exception:
+                    pass
+            self._ftp = None
     
-    def upload_to_ftp(self, filepath: Path) -> bool:
-        """Upload a file to FTP server."""
+    def _get_ftp(self) -> FTP:
+        """Return a live FTP connection, reconnecting only if the old one is dead."""
+        if self._ftp is not None:
+            try:
+                self._ftp.voidcmd('NOOP')
+                return self._ftp
+            except Exception:
+                logger.warning("[FTP] Connection lost, reconnecting...")
+                self._close_ftp()
+        
+        # Connect to FTP; directory setup below runs once per connection
+        ftp = FTP_TLS() if self.ftp_tls else FTP()
+        ftp.connect(self.ftp_host, self.ftp_port, timeout=30)
+        ftp.login(self.ftp_user, self.ftp_pass)
+        if self.ftp_tls:
+            # Encrypt the data channel too
+            ftp.prot_p()
+        
+        # Check current directory
+        current_dir = ftp.pwd()
+        logger.info("[FTP] Current directory: %s", current_dir)
+        
+        # Change to target directory
+        try:
+            ftp.cwd(self.ftp_folder)
+            logger.info("[FTP] Changed to directory: %s", self.ftp_folder)
+        except Exception as cwd_err:
+            logger.warning("[FTP] Could not change to %s: %s", self.ftp_folder, cwd_err)
+            # Try to create the directory
+            try:
+                logger.info("[FTP] Attempting to create directory: %s", self.ftp_folder)
+                ftp.mkd(self.ftp_folder)
+                ftp.cwd(self.ftp_folder)
+                logger.info("[FTP] Created and changed to %s", self.ftp_folder)
+            except Exception as mk_err:
+                logger.warning("[FTP] Could not create directory: %s", mk_err)
+                # Upload to current directory instead
+                logger.warning("[FTP] Uploading to current directory: %s", current_dir)
+        
+        self._ftp = ftp
+        return ftp
+    
+    def upload_to_ftp(self, filepath: Path, content: bytes) -> bool:
+        """Upload in-memory torrent content to the FTP server as filepath.name."""
         if not self.ftp_enabled:
             return False
         
         try:
-            print(f"[FTP] Uploading {filepath.name} to {self.ftp_host}:{self.ftp_port}{self.ftp_folder}")
-            
-            # Connect to FTP
-            ftp = FTP()
-            ftp.connect(self.ftp_host, self.ftp_port, timeout=30)
-            ftp.login(self.ftp_user, self.ftp_pass)
+            logger.info("[FTP] Uploading %s to %s:%s%s", filepath.name, self.ftp_host, self.ftp_port, self.ftp_folder)
             
-            # Check current directory
-            current_dir = ftp.pwd()
-            print(f"[FTP] Current directory: {current_dir}")
+            with self._ftp_lock:
+                # A reused connection can die between NOOP and STOR, so retry
+                # once on a fresh one before giving up
+                for attempt in range(2):
+                    ftp = self._get_ftp()
+                    try:
+                        ftp.storbinary(f'STOR {filepath.name}', io.BytesIO(content))
+                        break
+                    except Exception as e:
+                        self._close_ftp()
+                        if attempt:
+                            raise
+                        logger.warning("[FTP] Upload failed (%s), retrying on a new connection...", e)
             
-            # Change to target directory
-            try:
-                ftp.cwd(self.ftp_folder)
-                print(f"[FTP] Changed to directory: {self.ftp_folder}")
-            except Exception as cwd_err:
-                print(f"[FTP] Could not change to {self.ftp_folder}: {cwd_err}")
-                # List available directories
-                try:
-                    print(f"[FTP] Available in {current_dir}:")
-                    ftp.retrlines('LIST')
-                except:
-                    pass
-                # Try to create the directory
-                try:
-                    print(f"[FTP] Attempting to create directory: {self.ftp_folder}")
-                    ftp.mkd(self.ftp_folder)
-                    ftp.cwd(self.ftp_folder)
-                    print(f"[FTP] Created and changed to {self.ftp_folder}")
-                except Exception as mk_err:
-                    print(f"[FTP] Could not create directory: {mk_err}")
-                    # Upload to current directory instead
-                    print(f"[FTP] Uploading to current directory: {current_dir}")
-            
-            # Upload file
-            with open(filepath, 'rb') as f:
-                ftp.storbinary(f'STOR {filepath.name}', f)
-            
-            ftp.quit()
-            print(f"[FTP] ✓ Uploaded successfully")
+            logger.info("[FTP] ✓ Uploaded successfully")
             return True
             
         except Exception as e:
-            print(f"[FTP] Error uploading {filepath.name}: {e}")
-            self.stats['errors'] += 1
+            logger.error("[FTP] Error uploading %s: %s", filepath.name, e)
+            self._count('errors')
             return False
     
-    def download_torrent(self, url: str, title: str) -> bool:
-        """Download a torrent file and upload to FTP if configured."""
+    def download_torrent(self, url: str, title: str, content: Optional[bytes] = None) -> bool:
+        """Download a torrent file and upload to FTP if configured.
+        
+        If content is given (already fetched for the size check) it is
+        written directly instead of downloading again.
+        """
         try:
             # Sanitize filename
-            filename = re.sub(r'[<>:"/\\|?*]', '_', title)
+            filename = _SANITIZE_RE.sub('_', title)
             filename = filename[:200]  # Limit length
             if not filename.endswith('.torrent'):
                 filename += '.torrent'
             
             filepath = self.download_dir / filename
             
-            # Download
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            # Download unless the size check already fetched the file
+            if content is None:
+                response = self.session.get(url, timeout=30)
+                response.raise_for_status()
+                content = response.content
             
             with open(filepath, 'wb') as f:
-                f.write(response.content)
+                f.write(content)
             
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            print(f"[DOWNLOAD] [{timestamp}] ✓ {filename}")
-            self.stats['torrents_downloaded'] += 1
+            logger.info("[DOWNLOAD] ✓ %s", filename)
+            self._count('torrents_downloaded')
             
-            # Upload to FTP if enabled
+            # Upload to FTP in the background if enabled
             if self.ftp_enabled:
-                print(f"[FTP] Waiting 5 seconds before upload...")
-                time.sleep(5)
-                self.upload_to_ftp(filepath)
+                self._upload_pool.submit(self.upload_to_ftp, filepath, content)
             
             return True
             
         except Exception as e:
-            print(f"[DOWNLOAD] Error downloading {title[:40]}: {e}")
-            self.stats['errors'] += 1
+            logger.error("[DOWNLOAD] Error downloading %.40s: %s", title, e)
+            self._count('errors')
             return False
     
     def print_stats(self):
-        """Print statistics."""
+        """Log statistics (skipped under --quiet)."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         runtime = datetime.now() - self.stats['started_at']
         hours = int(runtime.total_seconds() // 3600)
         minutes = int((runtime.total_seconds() % 3600) // 60)
         
-        print(f"\n{'='*70}")
-        print(f"STATISTICS (Runtime: {hours}h {minutes}m)")
-        print(f"{'='*70}")
-        print(f"RSS Checks:           {self.stats['rss_checks']}")
-        print(f"Torrents Found:       {self.stats['torrents_found']}")
-        print(f"Torrents Downloaded:  {self.stats['torrents_downloaded']}")
-        print(f"Errors:               {self.stats['errors']}")
-        print(f"Processed IDs:        {len(self.processed_torrents)}")
-        print(f"Download Directory:   {self.download_dir}")
+        lines = [
+            "=" * 70,
+            f"STATISTICS (Runtime: {hours}h {minutes}m)",
+            "=" * 70,
+            f"RSS Checks:           {self.stats['rss_checks']}",
+            f"Torrents Found:       {self.stats['torrents_found']}",
+            f"Torrents Downloaded:  {self.stats['torrents_downloaded']}",
+            f"Errors:               {self.stats['errors']}",
+            f"Processed IDs:        {len(self.processed_torrents)}",
+            f"Download Directory:   {self.download_dir}",
+        ]
         if self.categories:
-            print(f"Categories Filter:    {', '.join(self.categories)}")
-        print(f"{'='*70}\n")
+            lines.append(f"Categories Filter:    {', '.join(self.categories)}")
+        lines.append("=" * 70)
+        # One record so the table stays in order with the other log output
+        logger.info("\n%s", "\n".join(lines))
     
     def run(self):
         """Main monitoring loop."""
-        self.running = True
+        self._stop.clear()
         
         # Connect to IRC
-        print("\n[MONITOR] Starting continuous monitor...")
-        print(f"[MONITOR] Download directory: {self.download_dir}")
+        logger.info("[MONITOR] Starting continuous monitor...")
+        logger.info("[MONITOR] Download directory: %s", self.download_dir)
         if self.categories:
-            print(f"[MONITOR] Filtering categories: {', '.join(self.categories)}")
+            logger.info("[MONITOR] Filtering categories: %s", ', '.join(self.categories))
         if self.min_size is not None:
-            print(f"[MONITOR] Minimum size: {self.min_size} GB")
+            logger.info("[MONITOR] Minimum size: %s GB", self.min_size)
         if self.max_size is not None:
-            print(f"[MONITOR] Maximum size: {self.max_size} GB")
-        print(f"[MONITOR] RSS check interval: 30 seconds (2x per minute)")
+            logger.info("[MONITOR] Maximum size: %s GB", self.max_size)
+        logger.info("[MONITOR] RSS check interval: 30 seconds (2x per minute)")
         if self.ftp_enabled:
-            print(f"[MONITOR] FTP upload enabled: {self.ftp_user}@{self.ftp_host}:{self.ftp_port}{self.ftp_folder}")
+            logger.info("[MONITOR] FTP upload enabled: %s@%s:%s%s%s", self.ftp_user, self.ftp_host, self.ftp_port,
+                        self.ftp_folder, " (TLS)" if self.ftp_tls else "")
         else:
-            print(f"[MONITOR] FTP upload disabled")
-        print()
-        
-        if self.irc_client.connect():
-            self.irc_client.start_monitor()
-        else:
-            print("[MONITOR] Warning: IRC connection failed. Only RSS monitoring will work.")
-        
-        print("[MONITOR] ✓ Monitor is running. Press Ctrl+C to stop.\n")
-        
-        last_stats_print = time.time()
+            logger.info("[MONITOR] FTP upload disabled")
         
         try:
-            while self.running:
+            if self.irc_client.connect():
+                self.irc_client.start_monitor()
+            else:
+                logger.warning("[MONITOR] Warning: IRC connection failed. Only RSS monitoring will work.")
+            
+            # RSS polling runs on this thread; keep it off the IRC reader's core
+            _pin_current_thread(WORKER_CPUS)
+            
+            logger.info("[MONITOR] ✓ Monitor is running. Press Ctrl+C to stop.")
+            
+            # Sleep until the nearest deadline; request_stop() wakes the wait immediately
+            next_rss = time.monotonic()
+            next_stats = next_rss + 300
+            
+            while not self._stop.wait(timeout=max(0, min(next_rss, next_stats) - time.monotonic())):
+                current_time = time.monotonic()
+                
                 # Check RSS feed every 30 seconds (2x per minute)
-                current_time = time.time()
-                if current_time - self.last_rss_check >= 30:
+                if current_time >= next_rss:
                     self.check_rss_feed()
-                    self.last_rss_check = current_time
+                    next_rss = current_time + 30
                 
                 # Print stats every 5 minutes
-                if current_time - last_stats_print >= 300:
+                if current_time >= next_stats:
                     self.print_stats()
-                    last_stats_print = current_time
-                
-                # Sleep briefly
-                time.sleep(1)
+                    next_stats = current_time + 300
                 
         except KeyboardInterrupt:
-            print("\n[MONITOR] Shutting down...")
+            logger.info("[MONITOR] Shutting down...")
         finally:
             self.stop()
     
+    def request_stop(self):
+        """Ask run() to shut down.
+        
+        The first request wakes the main loop, which finishes its current
+        step (e.g. an RSS fetch) and then stops. A repeated request raises
+        KeyboardInterrupt to break out of whatever call is blocking.
+        """
+        if self._stop.is_set():
+            raise KeyboardInterrupt
+        self._stop.set()
+    
     def stop(self):
         """Stop monitoring."""
-        self.running = False
+        self._stop.set()
         self.irc_client.stop_monitor()
         self.irc_client.disconnect()
+        # Let queued downloads, then uploads, finish before closing the FTP connection
+        self._work_pool.shutdown(wait=True)
+        self._upload_pool.shutdown(wait=True)
+        with self._ftp_lock:
+            self._close_ftp()
+        self.session.close()
+        try:
+            self._processed_file.close()
+        except Exception:
+            pass
         self.print_stats()
-        print("[MONITOR] Stopped.")
+        logger.info("[MONITOR] Stopped.")
 
 
 def main():
@@ -696,6 +1155,12 @@ The monitor will:
         help='FTP upload folder'
     )
     
+    parser.add_argument(
+        '--ftp-tls',
+        action='store_true',
+        help='Use explicit FTP over TLS (FTPS)'
+    )
+    
     parser.add_argument(
         '--no-ftp',
         action='store_true',
@@ -714,17 +1179,32 @@ The monitor will:
         help='Maximum torrent size in GB'
     )
     
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Only log warnings and errors'
+    )
+    
     args = parser.parse_args()
     
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format='%(asctime)s %(message)s',
+        datefmt='%H:%M:%S'
+    )
+    # httpx logs every request URL at INFO, and download URLs contain the RSS key
+    for name in ('httpx', 'httpcore', 'hpack'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    
     # Load configuration
     config = {}
     if args.config:
         try:
             with open(args.config, 'r') as f:
                 config = json.load(f)
-            print(f"[CONFIG] Loaded configuration from {args.config}")
+            logger.info("[CONFIG] Loaded configuration from %s", args.config)
         except Exception as e:
-            print(f"[CONFIG] Error loading config file: {e}")
+            logger.error("[CONFIG] Error loading config file: %s", e)
             sys.exit(1)
     
     # Merge config file with command line args (command line takes precedence)
@@ -738,6 +1218,7 @@ The monitor will:
     ftp_user = args.ftp_user or config.get('ftp_user')
     ftp_pass = args.ftp_pass or config.get('ftp_pass')
     ftp_folder = args.ftp_folder or config.get('ftp_folder')
+    ftp_tls = args.ftp_tls or config.get('ftp_tls', False)
     no_ftp = args.no_ftp or config.get('no_ftp', False)
     min_size = args.min_size or config.get('min_size')
     max_size = args.max_size or config.get('max_size')
@@ -754,15 +1235,16 @@ The monitor will:
         ftp_user=ftp_user,
         ftp_pass=ftp_pass,
         ftp_folder=ftp_folder,
+        ftp_tls=ftp_tls,
         min_size=min_size,
         max_size=max_size
     )
     
     # Handle signals for clean shutdown
     def signal_handler(sig, frame):
-        print("\n[SIGNAL] Received shutdown signal")
-        monitor.stop()
-        sys.exit(0)
+        logger.info("[SIGNAL] Received shutdown signal (send again to force)")
+        # run() performs the actual shutdown; a second signal interrupts blocking calls
+        monitor.request_stop()
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)